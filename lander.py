@@ -43,15 +43,41 @@ Concretely the lander will go through the following states,
 Descend has two internal states.  Above a fixed altitude it descends as
 fast as possible and works to stop horizontal movement.  Below this altitude
 it slows to a safe descent speed and aborts if horizontal speed is unsafe.
+
+The Lander and the states carry type annotations so the module can be
+compiled with mypyc (``mypyc lander.py``) when running it locally.
+CodinGame runs the plain source.
 '''
 
+from __future__ import annotations
+
 import sys
+from math import floor
 
 # Auto-generated code below aims at helping you parse
 # the standard input according to the problem statement.
-import collections
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Point:
+    x: int
+    y: int
 
-Point = collections.namedtuple('Point', ['x', 'y'])
+
+# Index of each state in Lander.states.  Transitions are made by id so the
+# state table is a plain tuple lookup.
+HOVER, MOVE_TOWARDS_LANDING_SPOT, DESCEND, STOP_HORIZONTAL_MOVEMENT = range(4)
+
+# Set to True to trace the surface search and state changes on stderr.
+DEBUG = False
+
+# Bound once so the game loop doesn't pay for input's prompt handling or print's
+# keyword handling each tick.
+_stdin_readline = sys.stdin.readline
+_stdout_write = sys.stdout.write
+_stdout_flush = sys.stdout.flush
+_stderr_write = sys.stderr.write
 
 
 class LandingSpot:
@@ -66,42 +92,47 @@ class LandingSpot:
         return 'Safe Spot from {} to {}'.format(self.start, self.end)
 
 
-class Surface(collections.MutableSequence):
+class Surface:
     '''
-    List like class to hold the data about the surface.
+    Holds the data about the surface.
+
+    The points are stored as separate lists of x and y coordinates so
+    find_safe_spot can scan neighbouring points by index without unpacking
+    a Point for each one.  Indexing and len still work as they would on a
+    list of Points.
 
     Only special method is find_safe_spot that returns a LandingSpot
     object which is used as a goal during landing.
     '''
+    __slots__ = ('_xs', '_ys')
+
     def __init__(self, *args):
-        self.list = list()
-        self.extend(list(args))
+        self._xs = []
+        self._ys = []
+        for point in args:
+            self.append(point)
+
+    def append(self, point):
+        self._xs.append(point.x)
+        self._ys.append(point.y)
 
     def __len__(self):
-        return len(self.list)
+        return len(self._xs)
 
     def __getitem__(self, i):
-        return self.list[i]
-
-    def __delitem__(self, i):
-        del self.list[i]
-
-    def __setitem__(self, i, v):
-        self.list[i] = v
-
-    def insert(self, i, v):
-        self.list.insert(i, v)
+        return Point(self._xs[i], self._ys[i])
 
     def __str__(self):
-        return str(self.list)
+        return str([Point(x, y) for x, y in zip(self._xs, self._ys)])
 
     def find_safe_spot(self):
-        old_spot = self.list[0]
-        for new_spot in self.list[1:]:
-            print(old_spot, new_spot, file=sys.stderr)
-            if new_spot.y == old_spot.y and new_spot.x - old_spot.x >= 1000:
-                return LandingSpot(old_spot, new_spot)
-            old_spot = new_spot
+        xs = self._xs
+        ys = self._ys
+        for i in range(1, len(xs)):
+            if DEBUG:
+                _stderr_write('%s %s\n' % (Point(xs[i - 1], ys[i - 1]), Point(xs[i], ys[i])))
+            if ys[i] == ys[i - 1] and xs[i] - xs[i - 1] >= 1000:
+                return LandingSpot(Point(xs[i - 1], ys[i - 1]), Point(xs[i], ys[i]))
         raise Exception('Failed to find safe spot')
 
 
@@ -111,40 +142,76 @@ class Lander:
 
     state is the current state of the lander.  The initial state is Hover.
 
+    states holds one instance of every state indexed by its state id.  The states
+    keep no data of their own between ticks so they are created once here and a
+    transition just makes a different one current.
+
     State transitinos are handled by the state it self.  The lander's responsibility
     is in holding the current state and parameters of the lander and communicating
     it the state's control outputs to the game.
     '''
-    def __init__(self, surface):
+    __slots__ = ('surface', 'x', 'y', 'speed_h', 'speed_v', 'fuel', 'rotate', 'power',
+                 'state', 'states', 'landing_spot', '_ls_left', '_ls_right', '_ls_height',
+                 'altitude', 'is_over_landing_spot', '_out_rot', '_out_pwr')
+
+    surface: Surface
+    x: int
+    y: int
+    speed_h: int
+    speed_v: int
+    fuel: int
+    rotate: int
+    power: int
+    state: State
+    states: tuple[State, ...]
+    landing_spot: LandingSpot
+    _ls_left: int
+    _ls_right: int
+    _ls_height: int
+    altitude: int
+    is_over_landing_spot: bool
+    _out_rot: int
+    _out_pwr: int
+
+    def __init__(self, surface: Surface) -> None:
         self.surface = surface
-        self.x = None
-        self.y = None
-        self.speed_h = None
-        self.speed_v = None
-        self.fuel = None
-        self.rotate = None
-        self.power = None
-        self.state = Hover(self, None)
+        # Zeroed rather than None so every field keeps the one type declared above.
+        # The game overwrites them all on the first update_state.
+        self.x = 0
+        self.y = 0
+        self.speed_h = 0
+        self.speed_v = 0
+        self.fuel = 0
+        self.rotate = 0
+        self.power = 0
+        self.altitude = 0
+        self.is_over_landing_spot = False
+        self._out_rot = 0
+        self._out_pwr = 0
+        # Ordered by state id.  The second argument is the id of the state to
+        # move to once the goal is reached.
+        self.states = (
+            Hover(self),
+            MoveTowardsLandingSpot(self, DESCEND),
+            Descend(self),
+            StopHorizontalMovement(self, MOVE_TOWARDS_LANDING_SPOT),
+        )
+        self.state = self.states[HOVER]
         self.landing_spot = self.surface.find_safe_spot()
+        # The landing spot never moves so keep its bounds on the lander itself.
+        self._ls_left = self.landing_spot.left
+        self._ls_right = self.landing_spot.right
+        self._ls_height = self.landing_spot.height
 
-    @property
-    def is_over_landing_spot(self):
-        return self.landing_spot.left <= self.x <= self.landing_spot.right
-
-    @property
-    def altitude(self):
-        return self.y - self.landing_spot.height
-
-    def update_state(self, x, y, speed_h, speed_v, fuel, rotate, power):
-        '''Takes the lander state from the game and updates the landers internal parameters.'''
-        self.x_old = self.x
-        self.y_old = self.y
-        self.speed_h_old = self.speed_h
-        self.speed_v_old = self.speed_v
-        self.fuel_old = self.fuel
-        self.rotate_old = self.rotate
-        self.power_old = self.power
+    def update_state(self, x: int, y: int, speed_h: int, speed_v: int, fuel: int, rotate: int,
+                     power: int) -> None:
+        '''
+        Takes the lander state from the game and updates the landers internal parameters.
 
+        altitude and is_over_landing_spot are read several times a tick by the states
+        so they are worked out here once rather than as properties.  The control outputs
+        for the tick are then calculated once and cached for control.
+        '''
         self.x = x
         self.y = y
         self.speed_h = speed_h
@@ -153,41 +220,58 @@ class Lander:
         self.rotate = rotate
         self.power = power
 
-    def control(self):
-        '''Communicates the control instructions to the game.'''
-        print('{} {}'.format(self.control_rotate, self.control_power))
+        self.altitude = y - self._ls_height
+        self.is_over_landing_spot = self._ls_left <= x <= self._ls_right
+
+        self._out_rot, self._out_pwr = self.state.step()
+
+    def control(self) -> None:
+        '''
+        Communicates the control instructions to the game.
+
+        The game waits for each line so it is flushed straight away rather than
+        relying on stdout being line buffered.
+        '''
+        _stdout_write('%d %d\n' % (self._out_rot, self._out_pwr))
+        _stdout_flush()
 
     @property
-    def control_rotate(self):
-        return self.state.control_rotate
+    def control_rotate(self) -> int:
+        return self._out_rot
 
     @property
-    def control_power(self):
-        return self.state.control_power
+    def control_power(self) -> int:
+        return self._out_pwr
 
     @property
-    def is_left_of_landing_spot(self):
-        return self.x < self.landing_spot.left
+    def is_left_of_landing_spot(self) -> bool:
+        return self.x < self._ls_left
 
     @property
-    def is_right_of_landing_spot(self):
-        return self.x > self.landing_spot.right
+    def is_right_of_landing_spot(self) -> bool:
+        return self.x > self._ls_right
 
     @property
-    def distance_to_landing_spot(self):
+    def distance_to_landing_spot(self) -> int | None:
         if self.is_left_of_landing_spot:
-            return self.x - self.landing_spot.left
+            return self.x - self._ls_left
         elif self.is_right_of_landing_spot:
-            return self.x - self.landing_spot.right
+            return self.x - self._ls_right
+        return None
 
 class State:
+    __slots__ = ('lander', 'rotate_limit', 'next_state')
+
+    lander: Lander
+    rotate_limit: int
+    next_state: int | None
 
     MAX_ROTATION = 90
     ROTATION_RATE_OF_CHANGE = 15
     MIN_POWER = 0
     MAX_POWER = 4
 
-    def __init__(self, lander, next_state=None):
+    def __init__(self, lander: Lander, next_state: int | None = None) -> None:
         '''
         Base class for all states.
 
@@ -195,9 +279,9 @@ class State:
         methods are called each tick of the simulation and are expected to return the goals
         for the rotation and power control methods.
 
-        control_rotate and control_power return the desired outputs the lander should feed
-        to the simulation to achieve the goals provided by the update_rotation and
-        update_power methods.  It should not be neccessary to override these methods.
+        step returns the desired outputs the lander should feed to the simulation to
+        achieve the goals provided by the update_rotation and update_power methods.  It
+        should not be neccessary to override this method.
 
         MAX_ROTATION - the lander won't try to rotate passed this angle.  90 degrees
         corresponds to horizontal.
@@ -206,67 +290,57 @@ class State:
         if its current rotation does not equal its desired rotation.
 
         :param lander: (Lander) object to control
-        :param next_state: (State) the state to transition to next if
-        goal is reached.
+        :param next_state: (int) id of the state to transition to next if
+        goal is reached.  The instance is looked up in lander.states.
         '''
         self.lander = lander
         self.rotate_limit = self.MAX_ROTATION
         self.next_state = next_state
 
     @property
-    def control_rotate(self):
-        '''
-        Calculate a control signal to send to the game.
-
-        Limit the signal to the max rotation
-        :return:
-        '''
-        desired_rotation = round(self.update_rotation())
-
-        if desired_rotation > self.rotate_limit:
-            return self.rotate_limit
-        elif desired_rotation < -self.rotate_limit:
-            return -self.rotate_limit
-        else:
-            return desired_rotation
-
-    @property
-    def rotate_left_limit(self):
+    def rotate_left_limit(self) -> int:
         return self.lander.rotate - self.ROTATION_RATE_OF_CHANGE
 
     @property
-    def rotate_right_limit(self):
+    def rotate_right_limit(self) -> int:
         return self.lander.rotate + self.ROTATION_RATE_OF_CHANGE
 
-    @property
-    def control_power(self):
+    def step(self) -> tuple[int, int]:
         '''
-        Calculate the power signal to send to the game.
+        Calculate the rotation and power signals to send to the game.
 
-        There are 4 power levels.  0 is trust off.  4 is max trust.
+        The rotation is limited to the max rotation.  There are 4 power levels.
+        0 is trust off.  4 is max trust.
 
-        The power is rounded to integer values.
+        Both signals are rounded to the nearest integer, halves round up.  update_rotation may
+        transition the lander to a new state so the power is taken from
+        whichever state is current once the rotation is known.
 
-        :return: int
+        :return: (int, int) rotation and power
         '''
-        desired_power = round(self.update_power())
+        # Clamped with conditional expressions rather than min(max(...)); in CPython the two
+        # builtin calls cost several times more than the inline comparisons.
+        limit = self.rotate_limit
+        rotation = floor(self.update_rotation() + 0.5)
+        rotation = -limit if rotation < -limit else limit if rotation > limit else rotation
 
-        if desired_power < self.MIN_POWER:
-            return self.MIN_POWER
-        elif desired_power > self.MAX_POWER:
-            return self.MAX_POWER
-        else:
-            return desired_power
+        power = floor(self.lander.state.update_power() + 0.5)
+        power = (self.MIN_POWER if power < self.MIN_POWER else
+                 self.MAX_POWER if power > self.MAX_POWER else power)
+
+        return rotation, power
 
-    def update_rotation(self):
+    def update_rotation(self) -> float:
         return 0
 
-    def update_power(self):
+    def update_power(self) -> float:
         return 4
 
 
 class Hover(State):
-    def __init__(self, lander, next_state=None):
+    __slots__ = ()
+
+    def __init__(self, lander: Lander, next_state: int | None = None) -> None:
         '''
         Hover steadily in horizontal and vertical axis.
 
@@ -278,10 +352,10 @@ class Hover(State):
         '''
         super().__init__(lander, next_state=next_state)
 
-    def update_rotation(self):
+    def update_rotation(self) -> float:
         return self.lander.speed_h
 
-    def update_power(self):
+    def update_power(self) -> float:
         if self.lander.speed_v > 0:
             return 3
         else:
@@ -289,11 +363,15 @@ class Hover(State):
 
 
 class MoveTowardsLandingSpot(Hover):
+    __slots__ = ('scale',)
+
+    scale: float
+
     MAX_SPEED = 20
     MAX_ANGLE = 45
     HOVER_ANGLE = 0
 
-    def __init__(self, lander, next_state):
+    def __init__(self, lander: Lander, next_state: int) -> None:
         '''
         Move in the direction of the landing spot then stop and hover.
 
@@ -307,9 +385,9 @@ class MoveTowardsLandingSpot(Hover):
         '''
         super().__init__(lander, next_state=next_state)
         self.scale = 0.04
-        self.next_state = Descend
+        self.next_state = DESCEND
 
-    def update_rotation(self):
+    def update_rotation(self) -> float:
         if self.is_too_fast:
             return self.transition_to_stop()
         elif self.lander.is_over_landing_spot:
@@ -317,43 +395,54 @@ class MoveTowardsLandingSpot(Hover):
         else:
             return self.move_towards_landing_spot()
 
-    def stop_and_transition_to_next_state(self):
+    def stop_and_transition_to_next_state(self) -> float:
         if self.has_safe_speed:
-            self.lander.state = self.next_state(self.lander)
+            assert self.next_state is not None
+            self.lander.state = self.lander.states[self.next_state]
             return self.lander.state.update_rotation()
         else:
             return self.transition_to_stop()
 
-    def move_towards_landing_spot(self):
-        if self.lander.is_left_of_landing_spot:
-            if self.lander.speed_h < self.MAX_SPEED:
-                return self.lander.distance_to_landing_spot * self.scale
-            elif self.lander.speed_h > self.MAX_SPEED:
+    def move_towards_landing_spot(self) -> float:
+        # Work from the distance to each edge directly rather than the lander's
+        # is_left/is_right/distance properties which repeat the same comparisons.
+        lander = self.lander
+        speed_h = lander.speed_h
+
+        distance = lander.x - lander._ls_left
+        if distance < 0:
+            if speed_h < self.MAX_SPEED:
+                return distance * self.scale
+            elif speed_h > self.MAX_SPEED:
                 return self.MAX_ANGLE
             else:
                 return self.HOVER_ANGLE
 
-        if self.lander.is_right_of_landing_spot:
-            if self.lander.speed_h > -self.MAX_SPEED:
-                return self.lander.distance_to_landing_spot * self.scale
-            elif self.lander.speed_h < -self.MAX_SPEED:
+        distance = lander.x - lander._ls_right
+        if distance > 0:
+            if speed_h > -self.MAX_SPEED:
+                return distance * self.scale
+            elif speed_h < -self.MAX_SPEED:
                 return -self.MAX_ANGLE
             else:
                 return self.HOVER_ANGLE
 
+        # Already over the landing spot.
+        return self.HOVER_ANGLE
+
     @property
-    def is_too_fast(self):
+    def is_too_fast(self) -> bool:
         return not (-self.MAX_SPEED <= self.lander.speed_h <= self.MAX_SPEED)
 
     @property
-    def has_safe_speed(self):
+    def has_safe_speed(self) -> bool:
         return -self.MAX_SPEED <= self.lander.speed_h <= self.MAX_SPEED
 
-    def transition_to_stop(self):
-        self.lander.state = StopHorizontalMovement(lander, MoveTowardsLandingSpot)
+    def transition_to_stop(self) -> float:
+        self.lander.state = self.lander.states[STOP_HORIZONTAL_MOVEMENT]
         return self.lander.state.update_rotation()
 
-    def update_power(self):
+    def update_power(self) -> float:
         if self.lander.altitude < 100 and not (self.lander.is_over_landing_spot):
             return 4
         if self.lander.speed_v > -18:
@@ -363,10 +452,14 @@ class MoveTowardsLandingSpot(Hover):
 
 
 class Descend(Hover):
+    __slots__ = ('scale',)
+
+    scale: float
+
     SAFE_DESCENT_SPEED = -18
     LANDING_ALTITUDE = 100
 
-    def __init__(self, lander, next_state=None):
+    def __init__(self, lander: Lander, next_state: int | None = None) -> None:
         '''
         Descend at a safe speed and stop horizontal movement.
 
@@ -375,7 +468,7 @@ class Descend(Hover):
         super().__init__(lander, next_state=next_state)
         self.scale = 0.01
 
-    def update_power(self):
+    def update_power(self) -> float:
         if self.is_not_safe_to_land:
             return 4
         if self.descent_is_too_fast:
@@ -383,23 +476,28 @@ class Descend(Hover):
         else:
             return 3
 
-    def update_rotation(self):
+    def update_rotation(self) -> float:
         if self.lander.altitude > self.LANDING_ALTITUDE:
             return self.lander.speed_h
         else:
             return 0
 
     @property
-    def is_not_safe_to_land(self):
+    def is_not_safe_to_land(self) -> bool:
         return (self.lander.altitude < self.LANDING_ALTITUDE and
                 not self.lander.is_over_landing_spot)
 
     @property
-    def descent_is_too_fast(self):
+    def descent_is_too_fast(self) -> bool:
         return self.lander.speed_v < self.SAFE_DESCENT_SPEED
 
 class StopHorizontalMovement(Hover):
-    def __init__(self, lander, next_state):
+    __slots__ = ('scale', 'cutoff')
+
+    scale: float
+    cutoff: int
+
+    def __init__(self, lander: Lander, next_state: int) -> None:
         '''
         Stop horizontal moverment as fast as possible attempt to hold altitude.
         '''
@@ -407,9 +505,10 @@ class StopHorizontalMovement(Hover):
         self.scale = 0.5
         self.cutoff = 20
 
-    def update_rotation(self):
+    def update_rotation(self) -> float:
         if -self.cutoff <= self.lander.speed_h <= self.cutoff:
-            self.lander.state = self.next_state(self.lander, None)
+            assert self.next_state is not None
+            self.lander.state = self.lander.states[self.next_state]
             return self.lander.state.update_rotation()
         return self.lander.speed_h * self.scale
 
@@ -417,21 +516,26 @@ class StopHorizontalMovement(Hover):
 def codingame_initilisation():
     '''Parses the inputs provide by codeingame.com'''
 
-    surface_n = int(input())  # the number of points used to draw the surface of Mars.
+    surface_n = int(_stdin_readline())  # the number of points used to draw the surface of Mars.
     surface = Surface()
     for i in range(surface_n):
-        land_x, land_y = [int(j) for j in input().split()]
+        land_x, land_y = map(int, _stdin_readline().split())
         surface.append(Point(land_x, land_y))
 
-    print(surface.find_safe_spot(), file=sys.stderr)
+    if DEBUG:
+        _stderr_write('%s\n' % surface.find_safe_spot())
     return surface
 
-if __name__=='__main__':
-    surface = codingame_initilisation()
-    lander = Lander(surface)
-    lander.state = MoveTowardsLandingSpot(lander)
-    previous_state = lander.state.__class__
-    # game loop
+def codingame_game_loop(lander):
+    '''
+    Feeds the game's readings to the lander each tick and sends back its controls.
+
+    The per-tick callables are bound to locals first so the loop doesn't look them
+    up through the module globals and the lander on every tick.
+    '''
+    readline = _stdin_readline
+    update_state = lander.update_state
+    control = lander.control
     while True:
         # h_speed: the horizontal speed (in m/s), can be negative.
         # v_speed: the vertical speed (in m/s), can be negative.
@@ -439,7 +543,15 @@ if __name__=='__main__':
         # rotate: the rotation angle in degrees (-90 to 90).
         # power: the thrust power (0 to 4).
         # x, y, h_speed, v_speed, fuel, rotate, power = [int(i) for i in input().split()]
-        args = [int(i) for i in input().split()]
-        lander.update_state(*args)
-        lander.control()
-        print(lander.state.__class__, file=sys.stderr)
+        update_state(*map(int, readline().split()))
+        control()
+        if DEBUG:
+            _stderr_write('%s\n' % lander.state.__class__)
+
+if __name__=='__main__':
+    surface = codingame_initilisation()
+    lander = Lander(surface)
+    lander.state = lander.states[MOVE_TOWARDS_LANDING_SPOT]
+    previous_state = lander.state.__class__
+    # game loop
+    codingame_game_loop(lander)